@@ -5,9 +5,91 @@ contoh dengan format PGM (P2). Jika Pillow tersedia, Anda bisa memproses PNG/JPG
 """
 
 from typing import List, Tuple
+import mmap
 import os
+import re
 import shutil
 
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+if np is not None and njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _dither_kernel(out, step):
+        """Kernel Floyd–Steinberg dua-baris: baris aktif dan baris bawah ditahan
+        di buffer lokal agar kuantisasi dan propagasi error selesai dalam satu
+        lintasan tanpa bolak-balik membaca array utama."""
+        h, w = out.shape
+        cur = np.empty(w, dtype=np.float32)
+        nxt = np.empty(w, dtype=np.float32)
+        for x in range(w):
+            cur[x] = out[0, x]
+        for y in range(h):
+            has_next = y + 1 < h
+            if has_next:
+                for x in range(w):
+                    nxt[x] = out[y + 1, x]
+            for x in range(w):
+                old = cur[x]
+                new = round(old / step) * step
+                q = int(new)
+                if q < 0:
+                    q = 0
+                elif q > 255:
+                    q = 255
+                out[y, x] = q
+                err = old - new
+                if x + 1 < w:
+                    v = cur[x + 1] + err * (7.0 / 16.0)
+                    cur[x + 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                if has_next:
+                    if x - 1 >= 0:
+                        v = nxt[x - 1] + err * (3.0 / 16.0)
+                        nxt[x - 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                    v = nxt[x] + err * (5.0 / 16.0)
+                    nxt[x] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                    if x + 1 < w:
+                        v = nxt[x + 1] + err * (1.0 / 16.0)
+                        nxt[x + 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+            tmp = cur
+            cur = nxt
+            nxt = tmp
+else:
+    _dither_kernel = None
+
+# Array uint8 per charset (hasil np.frombuffer), dihitung sekali per palet.
+_CHARSET_CACHE: dict = {}
+
+# LUT jadi per (charset, gamma, invert): kombinasi yang sama dipakai di
+# setiap frame, jadi tabelnya cukup dibangun sekali.
+_LUT_CACHE: dict = {}
+
+
+def _charset_array(charset: str):
+    """Purpose
+    Mengambil (atau membuat lalu menyimpan) array numpy uint8 dari byte
+    charset ASCII, untuk gather vektor saat membangun LUT.
+
+    Parameters
+    charset: String palet karakter (hanya ASCII).
+
+    Return value
+    Array numpy uint8 berisi kode karakter charset.
+    """
+    arr = _CHARSET_CACHE.get(charset)
+    if arr is None:
+        arr = np.frombuffer(charset.encode("ascii"), dtype=np.uint8)
+        _CHARSET_CACHE[charset] = arr
+    return arr
+
+
 def pil_to_pixels(img) -> List[List[int]]:
     """Purpose
     Mengonversi objek PIL Image (mode L) menjadi matriks 2D nilai piksel 0–255
@@ -64,27 +146,34 @@ def read_pgm(path: str) -> Tuple[List[List[int]], int, int]:
     path: Lokasi file PGM (format P2, ASCII).
     
     Return value
-    (pixels, width, height) di mana pixels adalah list 2D berisi nilai 0–255.
+    (pixels, width, height) di mana pixels adalah matriks 2D berisi nilai
+    0–255 (ndarray jika numpy tersedia, list bersarang jika tidak).
     """
-    tokens: List[str] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            tokens.extend(line.split())
-    if not tokens or tokens[0] != "P2":
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            data = re.sub(rb"#[^\n]*", b"", mm[:])
+        finally:
+            mm.close()
+    header = re.match(rb"\s*(\S+)\s+(\d+)\s+(\d+)\s+(\d+)\s", data)
+    if header is None or header.group(1) != b"P2":
         raise ValueError("File PGM harus berformat ASCII P2")
-    idx = 1
-    width = int(tokens[idx]); idx += 1
-    height = int(tokens[idx]); idx += 1
-    maxval = int(tokens[idx]); idx += 1
+    width = int(header.group(2))
+    height = int(header.group(3))
+    maxval = int(header.group(4))
     if maxval <= 0:
         raise ValueError("Nilai maxval tidak valid pada PGM")
     expected = width * height
-    values = list(map(int, tokens[idx:idx + expected]))
-    if len(values) != expected:
+    body = data[header.end():]
+    if np is not None:
+        values = np.fromstring(body, dtype=np.int32, sep=" ")
+        if values.size < expected:
+            raise ValueError("Jumlah piksel tidak sesuai dimensi PGM")
+        return values[:expected].astype(np.uint8).reshape(height, width), width, height
+    tokens = body.split()
+    if len(tokens) < expected:
         raise ValueError("Jumlah piksel tidak sesuai dimensi PGM")
+    values = list(map(int, tokens[:expected]))
     pixels: List[List[int]] = []
     for r in range(height):
         row = values[r * width:(r + 1) * width]
@@ -98,11 +187,11 @@ def resize_pixels(pixels: List[List[int]], new_width: int) -> List[List[int]]:
     cocok untuk render ASCII pada lebar tertentu.
     
     Parameters
-    pixels: Matriks piksel 2D bernilai 0–255.
+    pixels: Matriks piksel 2D bernilai 0–255 (list bersarang atau ndarray).
     new_width: Lebar baru yang diinginkan untuk ASCII art.
-    
+
     Return value
-    Matriks piksel 2D yang telah diubah ukurannya.
+    Matriks piksel 2D yang telah diubah ukurannya (ndarray jika numpy tersedia).
     """
     if new_width < 1:
         raise ValueError("new_width minimal 1")
@@ -112,12 +201,19 @@ def resize_pixels(pixels: List[List[int]], new_width: int) -> List[List[int]]:
         return []
     scale = new_width / float(orig_w)
     new_height = max(1, int(orig_h * scale * 0.43))
+    if np is not None:
+        # Pemetaan titik-tengah ala INTER_NEAREST_EXACT: sampel diambil dari
+        # pusat sel target, murni aritmetika bilangan bulat.
+        arr = np.asarray(pixels, dtype=np.uint8)
+        src_y = (2 * np.arange(new_height) + 1) * orig_h // (2 * new_height)
+        src_x = (2 * np.arange(new_width) + 1) * orig_w // (2 * new_width)
+        return arr[src_y[:, None], src_x[None, :]]
     resized: List[List[int]] = []
     for y in range(new_height):
-        src_y = min(orig_h - 1, int(y / new_height * orig_h))
+        src_y = (2 * y + 1) * orig_h // (2 * new_height)
         row: List[int] = []
         for x in range(new_width):
-            src_x = min(orig_w - 1, int(x / new_width * orig_w))
+            src_x = (2 * x + 1) * orig_w // (2 * new_width)
             row.append(pixels[src_y][src_x])
         resized.append(row)
     return resized
@@ -127,10 +223,10 @@ def resize_pixels_to_size(pixels: List[List[int]], new_width: int, new_height: i
     Mengubah ukuran matriks piksel ke dimensi tertentu menggunakan nearest-neighbor.
     
     Parameters
-    pixels: Matriks piksel 2D bernilai 0–255.
+    pixels: Matriks piksel 2D bernilai 0–255 (list bersarang atau ndarray).
     new_width: Lebar baru.
     new_height: Tinggi baru.
-    
+
     Return value
     Matriks piksel 2D yang telah diubah ukurannya ke (new_height x new_width).
     """
@@ -140,12 +236,19 @@ def resize_pixels_to_size(pixels: List[List[int]], new_width: int, new_height: i
     orig_w = len(pixels[0]) if orig_h > 0 else 0
     if orig_w == 0 or orig_h == 0:
         return []
+    if np is not None:
+        # Pemetaan titik-tengah ala INTER_NEAREST_EXACT: sampel diambil dari
+        # pusat sel target, murni aritmetika bilangan bulat.
+        arr = np.asarray(pixels, dtype=np.uint8)
+        src_y = (2 * np.arange(new_height) + 1) * orig_h // (2 * new_height)
+        src_x = (2 * np.arange(new_width) + 1) * orig_w // (2 * new_width)
+        return arr[src_y[:, None], src_x[None, :]]
     resized: List[List[int]] = []
     for y in range(new_height):
-        src_y = min(orig_h - 1, int(y / new_height * orig_h))
+        src_y = (2 * y + 1) * orig_h // (2 * new_height)
         row: List[int] = []
         for x in range(new_width):
-            src_x = min(orig_w - 1, int(x / new_width * orig_w))
+            src_x = (2 * x + 1) * orig_w // (2 * new_width)
             row.append(pixels[src_y][src_x])
         resized.append(row)
     return resized
@@ -168,25 +271,34 @@ def dither_pixels(pixels: List[List[int]], levels: int) -> List[List[int]]:
     if h == 0 or w == 0 or levels < 2:
         return pixels
     step = 255.0 / float(levels - 1)
+    if _dither_kernel is not None:
+        buf = np.asarray(pixels, dtype=np.int16)
+        _dither_kernel(buf, step)
+        return buf.astype(np.uint8)
+    if np is not None and isinstance(pixels, np.ndarray):
+        pixels = pixels.tolist()
     out = [row[:] for row in pixels]
-    def clamp(v: float) -> int:
-        if v < 0: return 0
-        if v > 255: return 255
-        return int(v)
+    last_x = w - 1
     for y in range(h):
+        out_y = out[y]
+        out_yn = out[y + 1] if y + 1 < h else None
         for x in range(w):
-            old = out[y][x]
+            old = out_y[x]
             new = round(old / step) * step
-            out[y][x] = clamp(new)
+            out_y[x] = 0 if new < 0 else (255 if new > 255 else int(new))
             err = old - new
-            if x + 1 < w:
-                out[y][x + 1] = clamp(out[y][x + 1] + err * 7 / 16)
-            if y + 1 < h:
-                if x - 1 >= 0:
-                    out[y + 1][x - 1] = clamp(out[y + 1][x - 1] + err * 3 / 16)
-                out[y + 1][x] = clamp(out[y + 1][x] + err * 5 / 16)
-                if x + 1 < w:
-                    out[y + 1][x + 1] = clamp(out[y + 1][x + 1] + err * 1 / 16)
+            if x < last_x:
+                v = out_y[x + 1] + err * 0.4375
+                out_y[x + 1] = 0 if v < 0 else (255 if v > 255 else int(v))
+            if out_yn is not None:
+                if x > 0:
+                    v = out_yn[x - 1] + err * 0.1875
+                    out_yn[x - 1] = 0 if v < 0 else (255 if v > 255 else int(v))
+                v = out_yn[x] + err * 0.3125
+                out_yn[x] = 0 if v < 0 else (255 if v > 255 else int(v))
+                if x < last_x:
+                    v = out_yn[x + 1] + err * 0.0625
+                    out_yn[x + 1] = 0 if v < 0 else (255 if v > 255 else int(v))
     return out
 
 
@@ -207,6 +319,52 @@ def get_terminal_width(default_width: int = 80) -> int:
         return default_width
 
 
+def _build_ascii_lut(charset: str, gamma: float, invert: bool) -> bytes:
+    """Purpose
+    Membangun lookup table 256 entri yang memetakan nilai grayscale langsung
+    ke byte karakter ASCII (sudah termasuk invert dan koreksi gamma).
+
+    Parameters
+    charset: String palet karakter dari gelap ke terang (hanya ASCII).
+    gamma: Koreksi gamma (1.0 berarti tanpa perubahan).
+    invert: Membalik terang-gelap sebelum pemetaan.
+
+    Return value
+    Objek bytes 256 entri: lut[v] adalah kode ASCII untuk piksel bernilai v.
+    """
+    key = (charset, round(gamma, 4), invert)
+    cached = _LUT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    n = len(charset) - 1
+    if np is not None:
+        # Konstruksi LUT juga divektorkan: 256 entri dihitung sekaligus.
+        vals = np.arange(256, dtype=np.float64) / 255.0
+        if invert:
+            vals = 1.0 - vals
+        if gamma > 0:
+            vals = vals ** gamma
+        idx = np.clip((vals * n).astype(np.int64), 0, n)
+        _LUT_CACHE[key] = _charset_array(charset)[idx].tobytes()
+        return _LUT_CACHE[key]
+    charset_b = charset.encode("ascii")
+    lut = bytearray(256)
+    for v in range(256):
+        val = v / 255.0
+        if invert:
+            val = 1.0 - val
+        if gamma > 0:
+            val = pow(val, gamma)
+        idx = int(val * n)
+        if idx < 0:
+            idx = 0
+        if idx > n:
+            idx = n
+        lut[v] = charset_b[idx]
+    _LUT_CACHE[key] = bytes(lut)
+    return _LUT_CACHE[key]
+
+
 def map_to_ascii(
     pixels: List[List[int]],
     charset: str = " .:-=+*#%@",
@@ -228,13 +386,27 @@ def map_to_ascii(
     Return value
     List baris string yang mewakili ASCII art.
     """
-    if not pixels:
+    if len(pixels) == 0:
         return []
     if len(charset) < 2:
         raise ValueError("charset minimal 2 karakter")
     work = pixels
-    if dither:
+    if dither and len(charset) < 16:
+        # Dengan >=16 tingkat, langkah kuantisasi sudah di bawah resolusi
+        # persepsi terminal sehingga dithering tidak menambah detail.
         work = dither_pixels(work, len(charset))
+    if charset.isascii():
+        lut = _build_ascii_lut(charset, gamma, invert)
+        if np is not None:
+            codes = np.frombuffer(lut, dtype=np.uint8)[np.asarray(work, dtype=np.uint8)]
+            return [codes[y].tobytes().decode("ascii") for y in range(codes.shape[0])]
+        buf = bytearray(len(work[0]))
+        lines_lut: List[str] = []
+        for row in work:
+            for x, v in enumerate(row):
+                buf[x] = lut[v]
+            lines_lut.append(buf.decode("ascii"))
+        return lines_lut
     lines: List[str] = []
     for row in work:
         line_chars = []
@@ -300,6 +472,8 @@ def image_to_ascii(
     ext = os.path.splitext(input_path.lower())[1]
     if ext == ".pgm":
         pixels, w, h = read_pgm(input_path)
+        if np is not None:
+            pixels = np.asarray(pixels, dtype=np.uint8)
         if height is not None:
             resized = resize_pixels_to_size(pixels, width, height)
         else:
@@ -354,7 +528,7 @@ if __name__ == "__main__":
         "--invert", action="store_true", help="Balik terang-gelap sebelum pemetaan"
     )
     parser.add_argument(
-        "--dither", action="store_true", help="Aktifkan dithering untuk detail di lebar kecil"
+        "--dither", action="store_true", help="Aktifkan dithering untuk detail di lebar kecil (otomatis dilewati bila charset >= 16 karakter)"
     )
     parser.add_argument(
         "--charset", type=str, default=" .:-=+*#%@", help="Palet karakter atau kata kunci: simple|dense"
@@ -0,0 +1,46 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Kernel AOT (Cython) untuk pipeline ASCII streaming.
+
+Resize nearest-neighbor (pemetaan titik-tengah, sama dengan _resize_indices
+di main.py) dan pemetaan LUT digabung menjadi satu lintasan C, lengkap
+dengan newline per baris, sehingga satu frame selesai dalam satu panggilan
+fungsi tanpa array perantara. Dipakai sebagai cadangan terkompilasi saat
+OpenCV tidak tersedia.
+
+Build: python setup.py build_ext --inplace
+"""
+
+
+cpdef bytes ascii_frame(const unsigned char[:, :] gray,
+                        const unsigned char[::1] char_lut,
+                        int new_width, int new_height):
+    """Purpose
+    Mengubah frame grayscale langsung menjadi bytes frame ASCII utuh
+    (resize + LUT + newline) dalam satu lintasan terkompilasi.
+
+    Parameters
+    gray: Memoryview uint8 2D frame grayscale sumber.
+    char_lut: LUT 256 entri hasil _build_ascii_lut (bytes uint8).
+    new_width: Lebar ASCII art.
+    new_height: Tinggi ASCII art.
+
+    Return value
+    Bytes frame lengkap, tiap baris diakhiri newline.
+    """
+    cdef Py_ssize_t orig_h = gray.shape[0]
+    cdef Py_ssize_t orig_w = gray.shape[1]
+    cdef Py_ssize_t y, x, src_y, src_x, pos
+    if orig_h == 0 or orig_w == 0 or new_width < 1 or new_height < 1:
+        return b""
+    out = bytearray(new_height * (new_width + 1))
+    cdef unsigned char[::1] buf = out
+    pos = 0
+    for y in range(new_height):
+        src_y = ((2 * y + 1) * orig_h) // (2 * new_height)
+        for x in range(new_width):
+            src_x = ((2 * x + 1) * orig_w) // (2 * new_width)
+            buf[pos] = char_lut[gray[src_y, src_x]]
+            pos += 1
+        buf[pos] = 0x0A
+        pos += 1
+    return bytes(out)
@@ -5,14 +5,201 @@ menskalakan sesuai rasio karakter, lalu memetakan ke karakter ASCII dan
 menampilkan secara real-time di terminal.
 """
 
+import atexit
 import os
+import queue
+import signal
 import sys
+import threading
 import time
 from typing import List, Tuple, Optional
 import shutil
 
+try:
+    import cv2  # type: ignore
+except Exception:
+    cv2 = None
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+if np is not None and njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _dither_kernel(out, step):
+        """Kernel Floyd–Steinberg dua-baris: baris aktif dan baris bawah ditahan
+        di buffer lokal agar kuantisasi dan propagasi error selesai dalam satu
+        lintasan tanpa bolak-balik membaca array utama."""
+        h, w = out.shape
+        cur = np.empty(w, dtype=np.float32)
+        nxt = np.empty(w, dtype=np.float32)
+        for x in range(w):
+            cur[x] = out[0, x]
+        for y in range(h):
+            has_next = y + 1 < h
+            if has_next:
+                for x in range(w):
+                    nxt[x] = out[y + 1, x]
+            for x in range(w):
+                old = cur[x]
+                new = round(old / step) * step
+                q = int(new)
+                if q < 0:
+                    q = 0
+                elif q > 255:
+                    q = 255
+                out[y, x] = q
+                err = old - new
+                if x + 1 < w:
+                    v = cur[x + 1] + err * (7.0 / 16.0)
+                    cur[x + 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                if has_next:
+                    if x - 1 >= 0:
+                        v = nxt[x - 1] + err * (3.0 / 16.0)
+                        nxt[x - 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                    v = nxt[x] + err * (5.0 / 16.0)
+                    nxt[x] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+                    if x + 1 < w:
+                        v = nxt[x + 1] + err * (1.0 / 16.0)
+                        nxt[x + 1] = 0.0 if v < 0 else (255.0 if v > 255 else float(int(v)))
+            tmp = cur
+            cur = nxt
+            nxt = tmp
+else:
+    _dither_kernel = None
+
+if np is not None and njit is not None:
+    try:
+        from numba import guvectorize  # type: ignore
+
+        @guvectorize(["(uint8[:], uint8[:], uint8[:])"], "(n),(m)->(n)",
+                     nopython=True, target="parallel", cache=True)
+        def _lut_rows_kernel(row, lut, out):
+            """Gather LUT per baris (out[i] = lut[row[i]]); baris-baris
+            dibagikan ke beberapa core oleh target parallel."""
+            for i in range(row.shape[0]):
+                out[i] = lut[row[i]]
+    except Exception:
+        _lut_rows_kernel = None
+else:
+    _lut_rows_kernel = None
+
+try:
+    # Kernel Cython opsional (resize+LUT AOT); build dengan
+    # `python setup.py build_ext --inplace` di folder ini.
+    from _ascii_kernel import ascii_frame as _ascii_frame  # type: ignore
+except Exception:
+    _ascii_frame = None
+
 _FACE_CASCADE = None
 
+# CLAHE CUDA bila build OpenCV mendukung dan ada GPU; selain itu None dan
+# seluruh pipeline tetap di CPU.
+_CUDA_CLAHE = None
+if cv2 is not None:
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            _CUDA_CLAHE = cv2.cuda.createCLAHE(clipLimit=2.6, tileGridSize=(8, 8))
+    except Exception:
+        _CUDA_CLAHE = None
+
+# Cache objek CLAHE per (clipLimit, tileGridSize): enhance_gray_array dan
+# enhance_faces memakai parameter berbeda, tiap kombinasi cukup dibuat sekali.
+_CLAHE_CACHE: dict = {}
+
+# Posisi wajah berubah lambat antar frame; detectMultiScale cukup dijalankan
+# tiap beberapa frame dan kotak terakhir dipakai ulang di antaranya.
+_FACE_CACHE: dict = {"frame_no": 0, "boxes": [], "interval": 5}
+_CURSOR_HIDDEN = False
+
+# Frame terakhir yang tercetak, untuk rendering berbasis diff: hanya baris
+# yang berubah yang dikirim ulang ke terminal.
+_PREV_LINES: List[str] = []
+_PREV_FRAME_BYTES: Optional[bytes] = None
+
+# Lebar terminal hanya dibaca ulang saat ditandai kotor: SIGWINCH di POSIX,
+# polling berkala di platform tanpa sinyal tersebut.
+_TERM_WIDTH_DIRTY = True
+
+
+def _mark_term_width_dirty(*_args) -> None:
+    """Purpose
+    Handler SIGWINCH: menandai bahwa lebar terminal perlu dibaca ulang.
+
+    Parameters
+    *_args: Argumen sinyal (diabaikan).
+
+    Return value
+    None
+    """
+    global _TERM_WIDTH_DIRTY
+    _TERM_WIDTH_DIRTY = True
+
+# Array uint8 per charset (hasil np.frombuffer), dihitung sekali per palet.
+_CHARSET_CACHE: dict = {}
+
+# LUT jadi per (charset, gamma, invert): kombinasi yang sama dipakai di
+# setiap frame, jadi tabelnya cukup dibangun sekali.
+_LUT_CACHE: dict = {}
+
+
+def _charset_array(charset: str):
+    """Purpose
+    Mengambil (atau membuat lalu menyimpan) array numpy uint8 dari byte
+    charset ASCII, untuk gather vektor saat membangun LUT.
+
+    Parameters
+    charset: String palet karakter (hanya ASCII).
+
+    Return value
+    Array numpy uint8 berisi kode karakter charset.
+    """
+    arr = _CHARSET_CACHE.get(charset)
+    if arr is None:
+        arr = np.frombuffer(charset.encode("ascii"), dtype=np.uint8)
+        _CHARSET_CACHE[charset] = arr
+    return arr
+
+# Cache index nearest-neighbor per (tinggi, lebar, target): dimensi frame
+# webcam/video tidak berubah antar frame, jadi src_y/src_x cukup dihitung
+# sekali. Dibatasi beberapa entri agar tidak tumbuh saat resolusi berganti.
+_RESIZE_INDEX_CACHE: dict = {}
+_RESIZE_INDEX_CACHE_MAX = 4
+
+
+def _resize_indices(orig_h: int, orig_w: int, new_height: int, new_width: int):
+    """Purpose
+    Mengambil (atau menghitung lalu menyimpan) pasangan array index
+    nearest-neighbor untuk kombinasi dimensi tertentu.
+
+    Parameters
+    orig_h: Tinggi sumber.
+    orig_w: Lebar sumber.
+    new_height: Tinggi target.
+    new_width: Lebar target.
+
+    Return value
+    Tuple (src_y kolom, src_x baris) siap dipakai untuk fancy indexing.
+    """
+    key = (orig_h, orig_w, new_height, new_width)
+    idx = _RESIZE_INDEX_CACHE.get(key)
+    if idx is None:
+        # Pemetaan titik-tengah ala INTER_NEAREST_EXACT: sampel diambil dari
+        # pusat sel target, murni aritmetika bilangan bulat.
+        src_y = (2 * np.arange(new_height) + 1) * orig_h // (2 * new_height)
+        src_x = (2 * np.arange(new_width) + 1) * orig_w // (2 * new_width)
+        if len(_RESIZE_INDEX_CACHE) >= _RESIZE_INDEX_CACHE_MAX:
+            _RESIZE_INDEX_CACHE.pop(next(iter(_RESIZE_INDEX_CACHE)))
+        idx = (src_y[:, None], src_x[None, :])
+        _RESIZE_INDEX_CACHE[key] = idx
+    return idx
+
 
 def resize_pixels(pixels: List[List[int]], new_width: int, ratio: float = 0.43) -> List[List[int]]:
     """Purpose
@@ -20,12 +207,12 @@ def resize_pixels(pixels: List[List[int]], new_width: int, ratio: float = 0.43)
     dengan rasio karakter monospaced.
     
     Parameters
-    pixels: Matriks piksel 2D bernilai 0–255.
+    pixels: Matriks piksel 2D bernilai 0–255 (list bersarang atau ndarray).
     new_width: Lebar baru untuk ASCII art.
     ratio: Rasio tinggi-karakter terhadap lebar (default 0.43).
-    
+
     Return value
-    Matriks piksel 2D yang telah diubah ukurannya.
+    Matriks piksel 2D yang telah diubah ukurannya (ndarray jika numpy tersedia).
     """
     if new_width < 1:
         raise ValueError("new_width minimal 1")
@@ -35,17 +222,43 @@ def resize_pixels(pixels: List[List[int]], new_width: int, ratio: float = 0.43)
         return []
     scale = new_width / float(orig_w)
     new_height = max(1, int(orig_h * scale * ratio))
+    if np is not None:
+        arr = np.asarray(pixels, dtype=np.uint8)
+        idx = _resize_indices(orig_h, orig_w, new_height, new_width)
+        return arr[idx[0], idx[1]]
     resized: List[List[int]] = []
     for y in range(new_height):
-        src_y = min(orig_h - 1, int(y / new_height * orig_h))
+        src_y = (2 * y + 1) * orig_h // (2 * new_height)
         row: List[int] = []
         for x in range(new_width):
-            src_x = min(orig_w - 1, int(x / new_width * orig_w))
+            src_x = (2 * x + 1) * orig_w // (2 * new_width)
             row.append(pixels[src_y][src_x])
         resized.append(row)
     return resized
 
 
+def resize_gray(gray, new_width: int, ratio: float = 0.43):
+    """Purpose
+    Menskalakan citra grayscale ke lebar target dengan cv2.resize INTER_AREA
+    (downsampling ter-anti-alias di jalur C/SIMD OpenCV); jatuh kembali ke
+    resize_pixels nearest-neighbor bila OpenCV tidak tersedia.
+
+    Parameters
+    gray: Array numpy grayscale 2D (atau matriks list untuk jalur fallback).
+    new_width: Lebar baru untuk ASCII art.
+    ratio: Rasio tinggi-karakter terhadap lebar (default 0.43).
+
+    Return value
+    Citra grayscale 2D berukuran baru.
+    """
+    if cv2 is not None and np is not None and isinstance(gray, np.ndarray):
+        orig_h, orig_w = gray.shape
+        scale = new_width / float(orig_w)
+        new_height = max(1, int(orig_h * scale * ratio))
+        return cv2.resize(gray, (new_width, new_height), interpolation=cv2.INTER_AREA)
+    return resize_pixels(gray, new_width, ratio)
+
+
 def dither_pixels(pixels: List[List[int]], levels: int) -> List[List[int]]:
     """Purpose
     Menerapkan Floyd–Steinberg dithering pada piksel grayscale untuk menjaga detail di lebar kecil.
@@ -62,28 +275,247 @@ def dither_pixels(pixels: List[List[int]], levels: int) -> List[List[int]]:
     if h == 0 or w == 0 or levels < 2:
         return pixels
     step = 255.0 / float(levels - 1)
+    if _dither_kernel is not None:
+        buf = np.asarray(pixels, dtype=np.int16)
+        _dither_kernel(buf, step)
+        return buf.astype(np.uint8)
+    if np is not None and isinstance(pixels, np.ndarray):
+        pixels = pixels.tolist()
     out = [row[:] for row in pixels]
-    def clamp(v: float) -> int:
-        if v < 0: return 0
-        if v > 255: return 255
-        return int(v)
+    last_x = w - 1
     for y in range(h):
+        out_y = out[y]
+        out_yn = out[y + 1] if y + 1 < h else None
         for x in range(w):
-            old = out[y][x]
+            old = out_y[x]
             new = round(old / step) * step
-            out[y][x] = clamp(new)
+            out_y[x] = 0 if new < 0 else (255 if new > 255 else int(new))
             err = old - new
-            if x + 1 < w:
-                out[y][x + 1] = clamp(out[y][x + 1] + err * 7 / 16)
-            if y + 1 < h:
-                if x - 1 >= 0:
-                    out[y + 1][x - 1] = clamp(out[y + 1][x - 1] + err * 3 / 16)
-                out[y + 1][x] = clamp(out[y + 1][x] + err * 5 / 16)
-                if x + 1 < w:
-                    out[y + 1][x + 1] = clamp(out[y + 1][x + 1] + err * 1 / 16)
+            if x < last_x:
+                v = out_y[x + 1] + err * 0.4375
+                out_y[x + 1] = 0 if v < 0 else (255 if v > 255 else int(v))
+            if out_yn is not None:
+                if x > 0:
+                    v = out_yn[x - 1] + err * 0.1875
+                    out_yn[x - 1] = 0 if v < 0 else (255 if v > 255 else int(v))
+                v = out_yn[x] + err * 0.3125
+                out_yn[x] = 0 if v < 0 else (255 if v > 255 else int(v))
+                if x < last_x:
+                    v = out_yn[x + 1] + err * 0.0625
+                    out_yn[x + 1] = 0 if v < 0 else (255 if v > 255 else int(v))
     return out
 
 
+def _build_ascii_lut(charset: str, gamma: float, invert: bool) -> bytes:
+    """Purpose
+    Membangun lookup table 256 entri yang memetakan nilai grayscale langsung
+    ke byte karakter ASCII (sudah termasuk invert dan koreksi gamma).
+
+    Parameters
+    charset: String palet karakter dari gelap ke terang (hanya ASCII).
+    gamma: Koreksi gamma (1.0 berarti tanpa perubahan).
+    invert: Membalik terang-gelap sebelum pemetaan.
+
+    Return value
+    Objek bytes 256 entri: lut[v] adalah kode ASCII untuk piksel bernilai v.
+    """
+    key = (charset, round(gamma, 4), invert)
+    cached = _LUT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    n = len(charset) - 1
+    if np is not None:
+        # Konstruksi LUT juga divektorkan: 256 entri dihitung sekaligus.
+        vals = np.arange(256, dtype=np.float64) / 255.0
+        if invert:
+            vals = 1.0 - vals
+        if gamma > 0:
+            vals = vals ** gamma
+        idx = np.clip((vals * n).astype(np.int64), 0, n)
+        _LUT_CACHE[key] = _charset_array(charset)[idx].tobytes()
+        return _LUT_CACHE[key]
+    charset_b = charset.encode("ascii")
+    lut = bytearray(256)
+    for v in range(256):
+        val = v / 255.0
+        if invert:
+            val = 1.0 - val
+        if gamma > 0:
+            val = pow(val, gamma)
+        idx = int(val * n)
+        if idx < 0:
+            idx = 0
+        if idx > n:
+            idx = n
+        lut[v] = charset_b[idx]
+    _LUT_CACHE[key] = bytes(lut)
+    return _LUT_CACHE[key]
+
+
+def _apply_lut(arr, lut_arr):
+    """Purpose
+    Menerapkan LUT 256 entri ke array piksel 2D: kernel guvectorize paralel
+    bila numba tersedia, selain itu fancy indexing numpy biasa.
+
+    Parameters
+    arr: Array numpy uint8 2D piksel.
+    lut_arr: Array numpy uint8 256 entri.
+
+    Return value
+    Array numpy uint8 2D hasil gather.
+    """
+    if _lut_rows_kernel is not None and arr.ndim == 2 and arr.shape[1] > 0:
+        out = np.empty_like(arr)
+        _lut_rows_kernel(arr, lut_arr, out)
+        return out
+    return lut_arr[arr]
+
+
+def map_to_codes(
+    pixels,
+    charset: str = " .:-=+*#%@",
+    gamma: float = 1.0,
+    invert: bool = False,
+    dither: bool = False,
+):
+    """Purpose
+    Memetakan piksel langsung ke grid 2D kode ASCII (uint8) lewat LUT numpy,
+    tanpa membangun list string perantara. Dipakai jalur streaming.
+
+    Parameters
+    pixels: Matriks piksel 2D bernilai 0–255.
+    charset: String palet karakter (hanya ASCII untuk jalur ini).
+    gamma: Koreksi gamma (1.0 berarti tanpa perubahan).
+    invert: Membalik terang-gelap sebelum pemetaan.
+    dither: Mengaktifkan dithering.
+
+    Return value
+    Array numpy uint8 (tinggi x lebar) berisi byte ASCII, atau None jika
+    jalur numpy/charset ASCII tidak tersedia.
+    """
+    if np is None or not charset.isascii():
+        return None
+    if len(pixels) == 0 or len(charset) < 2:
+        return None
+    work = pixels
+    if dither and len(charset) < 16:
+        # Dengan >=16 tingkat, langkah kuantisasi sudah di bawah resolusi
+        # persepsi terminal sehingga dithering tidak menambah detail.
+        work = dither_pixels(work, len(charset))
+    lut = _build_ascii_lut(charset, gamma, invert)
+    return _apply_lut(np.asarray(work, dtype=np.uint8), np.frombuffer(lut, dtype=np.uint8))
+
+
+def frame_to_codes(
+    gray,
+    new_width: int,
+    charset: str = " .:-=+*#%@",
+    gamma: float = 1.0,
+    invert: bool = False,
+    dither: bool = False,
+    ratio: float = 0.43,
+):
+    """Purpose
+    Menggabungkan resize dan pemetaan LUT menjadi satu kernel untuk jalur
+    streaming: piksel sumber langsung digather melalui tabel charset tanpa
+    menyimpan array hasil resize sebagai perantara.
+
+    Parameters
+    gray: Array numpy grayscale 2D dari frame.
+    new_width: Lebar ASCII art.
+    charset: String palet karakter (hanya ASCII untuk jalur ini).
+    gamma: Koreksi gamma.
+    invert: Membalik terang-gelap.
+    dither: Mengaktifkan dithering (memakai jalur resize terpisah karena
+    dither butuh piksel grayscale hasil resize).
+    ratio: Rasio tinggi-karakter terhadap lebar.
+
+    Return value
+    Array numpy uint8 (tinggi x lebar) berisi byte ASCII, atau None jika
+    jalur cepat tidak tersedia.
+    """
+    if np is None or not isinstance(gray, np.ndarray):
+        return None
+    if not charset.isascii() or len(charset) < 2:
+        return None
+    if dither and len(charset) < 16:
+        return map_to_codes(resize_gray(gray, new_width, ratio), charset=charset,
+                            gamma=gamma, invert=invert, dither=True)
+    orig_h, orig_w = gray.shape
+    if orig_h == 0 or orig_w == 0:
+        return None
+    scale = new_width / float(orig_w)
+    new_height = max(1, int(orig_h * scale * ratio))
+    lut = np.frombuffer(_build_ascii_lut(charset, gamma, invert), dtype=np.uint8)
+    if cv2 is not None:
+        return _apply_lut(cv2.resize(gray, (new_width, new_height), interpolation=cv2.INTER_AREA), lut)
+    idx = _resize_indices(orig_h, orig_w, new_height, new_width)
+    return _apply_lut(np.ascontiguousarray(gray[idx[0], idx[1]]), lut)
+
+
+def codes_to_bytes(codes) -> bytes:
+    """Purpose
+    Menggabungkan grid kode ASCII menjadi satu objek bytes utuh dengan kolom
+    newline tambahan, sehingga seluruh frame bisa ditulis sekali jalan.
+
+    Parameters
+    codes: Array numpy uint8 (tinggi x lebar) berisi byte ASCII.
+
+    Return value
+    Bytes frame lengkap, satu baris per baris grid diakhiri newline.
+    """
+    nl = np.full((codes.shape[0], 1), 0x0A, dtype=np.uint8)
+    return np.concatenate([codes, nl], axis=1).tobytes()
+
+
+def frame_to_bytes(
+    gray,
+    new_width: int,
+    charset: str = " .:-=+*#%@",
+    gamma: float = 1.0,
+    invert: bool = False,
+    dither: bool = False,
+    ratio: float = 0.43,
+) -> Optional[bytes]:
+    """Purpose
+    Menghasilkan bytes frame ASCII utuh lewat jalur tercepat yang tersedia:
+    kernel Cython terkompilasi (bila OpenCV absen) atau frame_to_codes +
+    codes_to_bytes.
+
+    Parameters
+    gray: Array numpy grayscale 2D dari frame.
+    new_width: Lebar ASCII art.
+    charset: String palet karakter (hanya ASCII untuk jalur ini).
+    gamma: Koreksi gamma.
+    invert: Membalik terang-gelap.
+    dither: Mengaktifkan dithering.
+    ratio: Rasio tinggi-karakter terhadap lebar.
+
+    Return value
+    Bytes frame lengkap siap print_frame_bytes, atau None jika jalur cepat
+    tidak tersedia.
+    """
+    if (
+        _ascii_frame is not None
+        and cv2 is None
+        and np is not None
+        and isinstance(gray, np.ndarray)
+        and charset.isascii()
+        and len(charset) >= 2
+        and not (dither and len(charset) < 16)
+    ):
+        orig_h, orig_w = gray.shape
+        if orig_h and orig_w:
+            new_height = max(1, int(orig_h * (new_width / float(orig_w)) * ratio))
+            lut = _build_ascii_lut(charset, gamma, invert)
+            return _ascii_frame(np.ascontiguousarray(gray), lut, new_width, new_height)
+    codes = frame_to_codes(gray, new_width, charset=charset, gamma=gamma,
+                           invert=invert, dither=dither, ratio=ratio)
+    if codes is not None:
+        return codes_to_bytes(codes)
+    return None
+
+
 def map_to_ascii(
     pixels: List[List[int]],
     charset: str = " .:-=+*#%@",
@@ -101,13 +533,25 @@ def map_to_ascii(
     Return value
     List baris string ASCII art.
     """
-    if not pixels:
+    if len(pixels) == 0:
         return []
     if len(charset) < 2:
         raise ValueError("charset minimal 2 karakter")
+    codes = map_to_codes(pixels, charset=charset, gamma=gamma, invert=invert, dither=dither)
+    if codes is not None:
+        return [codes[y].tobytes().decode("ascii") for y in range(codes.shape[0])]
     work = pixels
-    if dither:
+    if dither and len(charset) < 16:
         work = dither_pixels(work, len(charset))
+    if charset.isascii():
+        lut = _build_ascii_lut(charset, gamma, invert)
+        buf = bytearray(len(work[0]))
+        lines_lut: List[str] = []
+        for row in work:
+            for x, v in enumerate(row):
+                buf[x] = lut[v]
+            lines_lut.append(buf.decode("ascii"))
+        return lines_lut
     lines: List[str] = []
     for row in work:
         line_chars = []
@@ -127,69 +571,148 @@ def map_to_ascii(
     return lines
 
 
-def frame_to_pixels(frame) -> List[List[int]]:
+def frame_to_pixels(frame):
     """Purpose
-    Mengonversi frame numpy (BGR) dari OpenCV menjadi matriks 2D grayscale.
-    
+    Mengonversi frame numpy (BGR) dari OpenCV menjadi array 2D grayscale.
+
     Parameters
     frame: Array numpy frame BGR dari OpenCV.
-    
+
     Return value
-    Matriks piksel 2D bernilai 0–255.
+    Array numpy grayscale 2D bernilai 0–255 (tanpa konversi ke list).
     """
-    try:
-        import cv2  # type: ignore
-    except Exception as e:
-        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python") from e
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    h, w = gray.shape
-    rows: List[List[int]] = []
-    for y in range(h):
-        rows.append(list(gray[y, :]))
-    return rows
+    if cv2 is None:
+        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python")
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
 
-def enhance_gray_array(gray):
+def _get_clahe(clip: float, grid: Tuple[int, int]):
+    """Purpose
+    Mengambil (atau membuat lalu menyimpan) objek CLAHE untuk kombinasi
+    parameter tertentu, mengikuti pola _FACE_CASCADE.
+
+    Parameters
+    clip: Nilai clipLimit CLAHE.
+    grid: Tuple tileGridSize CLAHE.
+
+    Return value
+    Objek cv2.CLAHE siap pakai ulang antar frame.
+    """
+    key = (clip, grid)
+    clahe = _CLAHE_CACHE.get(key)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=clip, tileGridSize=grid)
+        _CLAHE_CACHE[key] = clahe
+    return clahe
+
+
+class GrayEnhancer:
+    """Pipeline clarity dengan buffer scratch persisten.
+
+    Setiap tahap OpenCV menulis ke buffer dst= milik objek ini, sehingga
+    enam alokasi Mat penuh per frame hilang dan buffer tetap hangat di
+    cache antar tahap. Buffer dialokasikan ulang hanya saat dimensi frame
+    berubah; array hasil dipakai ulang di frame berikutnya, jadi konsumsi
+    harus selesai sebelum panggilan berikutnya (pola streaming).
+    """
+
+    def __init__(self) -> None:
+        self._shape: Optional[Tuple[int, int]] = None
+        self._eq = None
+        self._smooth = None
+        self._blur = None
+        self._sharp = None
+        self._edges = None
+
+    def _ensure(self, gray) -> None:
+        """Purpose
+        Menyiapkan (atau mengalokasikan ulang) buffer scratch sesuai
+        dimensi frame.
+
+        Parameters
+        gray: Array numpy grayscale 2D acuan bentuk dan dtype.
+
+        Return value
+        None
+        """
+        if self._shape != gray.shape:
+            self._eq = np.empty_like(gray)
+            self._smooth = np.empty_like(gray)
+            self._blur = np.empty_like(gray)
+            self._sharp = np.empty_like(gray)
+            self._edges = np.empty_like(gray)
+            self._shape = gray.shape
+
+    def enhance(self, gray, fast: bool = False):
+        """Purpose
+        Menjalankan rantai CLAHE + smoothing + sharpen + edge boost tanpa
+        alokasi intermediate baru.
+
+        Parameters
+        gray: Array numpy grayscale 2D.
+        fast: Pakai edgePreservingFilter rekursif (O(1) per piksel) sebagai
+        pengganti bilateral filter yang menyentuh d^2 tetangga.
+
+        Return value
+        Array numpy grayscale 2D yang telah ditingkatkan (buffer internal).
+        """
+        self._ensure(gray)
+        if _CUDA_CLAHE is not None:
+            # Tahap CLAHE di GPU; tahap lain tetap CPU karena padanan
+            # cv2.cuda-nya tidak tersedia di build standar.
+            gpu = cv2.cuda_GpuMat()
+            gpu.upload(gray)
+            _CUDA_CLAHE.apply(gpu, cv2.cuda.Stream_Null()).download(self._eq)
+        else:
+            _get_clahe(2.6, (8, 8)).apply(gray, self._eq)
+        if fast:
+            bgr = cv2.edgePreservingFilter(
+                cv2.cvtColor(self._eq, cv2.COLOR_GRAY2BGR),
+                flags=cv2.RECURS_FILTER, sigma_s=10, sigma_r=0.15)
+            cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY, dst=self._smooth)
+        else:
+            cv2.bilateralFilter(self._eq, 5, 60, 60, dst=self._smooth)
+        cv2.GaussianBlur(self._smooth, (0, 0), 1.2, dst=self._blur)
+        cv2.addWeighted(self._smooth, 1.8, self._blur, -0.8, 0, dst=self._sharp)
+        cv2.Canny(self._eq, 40, 120, edges=self._edges)
+        cv2.GaussianBlur(self._edges, (0, 0), 1.0, dst=self._edges)
+        cv2.addWeighted(self._sharp, 1.0, self._edges, 0.25, 0, dst=self._sharp)
+        return self._sharp
+
+
+_GRAY_ENHANCER: Optional[GrayEnhancer] = None
+
+
+def enhance_gray_array(gray, fast: bool = False):
     """Purpose
     Meningkatkan kejelasan citra grayscale dan mengembalikan array numpy.
-    
+
     Parameters
     gray: Array numpy grayscale 2D.
-    
+    fast: Pakai smoothing rekursif yang lebih murah (lihat GrayEnhancer).
+
     Return value
     Array numpy grayscale 2D yang telah ditingkatkan.
     """
-    try:
-        import cv2  # type: ignore
-    except Exception:
+    global _GRAY_ENHANCER
+    if cv2 is None:
         return gray
-    clahe = cv2.createCLAHE(clipLimit=2.6, tileGridSize=(8, 8))
-    eq = clahe.apply(gray)
-    smooth = cv2.bilateralFilter(eq, d=5, sigmaColor=60, sigmaSpace=60)
-    blur = cv2.GaussianBlur(smooth, (0, 0), sigmaX=1.2)
-    sharp = cv2.addWeighted(smooth, 1.8, blur, -0.8, 0)
-    edges = cv2.Canny(eq, 40, 120)
-    edges = cv2.GaussianBlur(edges, (0, 0), sigmaX=1.0)
-    sharp = cv2.addWeighted(sharp, 1.0, edges, 0.25, 0)
-    return sharp
+    if _GRAY_ENHANCER is None:
+        _GRAY_ENHANCER = GrayEnhancer()
+    return _GRAY_ENHANCER.enhance(gray, fast=fast)
 
 
-def enhance_gray(gray) -> List[List[int]]:
+def enhance_gray(gray):
     """Purpose
     Meningkatkan kejelasan citra grayscale dengan CLAHE dan penajaman ringan.
-    
+
     Parameters
     gray: Array numpy grayscale 2D.
-    
+
     Return value
-    Matriks piksel 2D bernilai 0–255 setelah peningkatan.
+    Array numpy grayscale 2D bernilai 0–255 setelah peningkatan.
     """
-    sharp = enhance_gray_array(gray)
-    h, w = sharp.shape
-    out: List[List[int]] = []
-    for y in range(h):
-        out.append(list(sharp[y, :]))
-    return out
+    return enhance_gray_array(gray)
 
 
 def get_face_cascade():
@@ -203,9 +726,7 @@ def get_face_cascade():
     CascadeClassifier atau None jika tidak tersedia.
     """
     global _FACE_CASCADE
-    try:
-        import cv2  # type: ignore
-    except Exception:
+    if cv2 is None:
         return None
     if _FACE_CASCADE is None:
         path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
@@ -226,33 +747,39 @@ def detect_faces(gray) -> List[Tuple[int, int, int, int]]:
     Return value
     List tuple (x, y, w, h) untuk setiap wajah.
     """
-    try:
-        import cv2  # type: ignore
-    except Exception:
-        return []
     cascade = get_face_cascade()
     if cascade is None:
         return []
+    h, w = gray.shape[:2]
+    if min(h, w) >= 160:
+        # Deteksi pada setengah resolusi: biaya cascade kira-kira kuadratik
+        # terhadap jumlah piksel, kotak hasil diskalakan kembali 2x.
+        small = cv2.resize(gray, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        faces = cascade.detectMultiScale(small, scaleFactor=1.1, minNeighbors=5, minSize=(20, 20))
+        return [(int(x) * 2, int(y) * 2, int(fw) * 2, int(fh) * 2) for (x, y, fw, fh) in faces]
     faces = cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(40, 40))
-    return [(int(x), int(y), int(w), int(h)) for (x, y, w, h) in faces]
+    return [(int(x), int(y), int(fw), int(fh)) for (x, y, fw, fh) in faces]
 
 
-def enhance_faces(gray, strong: bool = False):
+def enhance_faces(gray, strong: bool = False, fast: bool = False):
     """Purpose
     Meningkatkan kontras pada area wajah agar lebih jelas di ASCII.
-    
+
     Parameters
     gray: Array numpy grayscale 2D.
     strong: Aktifkan peningkatan yang lebih agresif.
-    
+    fast: Pakai smoothing rekursif yang lebih murah di area wajah.
+
     Return value
     Array numpy grayscale 2D dengan wajah yang ditonjolkan.
     """
-    try:
-        import cv2  # type: ignore
-    except Exception:
+    if cv2 is None:
         return gray
-    faces = detect_faces(gray)
+    n = _FACE_CACHE["frame_no"]
+    _FACE_CACHE["frame_no"] = n + 1
+    if n % _FACE_CACHE["interval"] == 0:
+        _FACE_CACHE["boxes"] = detect_faces(gray)
+    faces = _FACE_CACHE["boxes"]
     if not faces:
         return gray
     out = gray.copy()
@@ -266,12 +793,15 @@ def enhance_faces(gray, strong: bool = False):
         roi = out[y0:y1, x0:x1]
         if roi.size == 0:
             continue
-        if strong:
-            clahe = cv2.createCLAHE(clipLimit=3.4, tileGridSize=(6, 6))
-        else:
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(6, 6))
+        clahe = _get_clahe(3.4 if strong else 3.0, (6, 6))
         roi_eq = clahe.apply(roi)
-        roi_smooth = cv2.bilateralFilter(roi_eq, d=5, sigmaColor=50, sigmaSpace=50)
+        if fast:
+            roi_smooth = cv2.cvtColor(
+                cv2.edgePreservingFilter(cv2.cvtColor(roi_eq, cv2.COLOR_GRAY2BGR),
+                                         flags=cv2.RECURS_FILTER, sigma_s=10, sigma_r=0.15),
+                cv2.COLOR_BGR2GRAY)
+        else:
+            roi_smooth = cv2.bilateralFilter(roi_eq, d=5, sigmaColor=50, sigmaSpace=50)
         roi_blur = cv2.GaussianBlur(roi_smooth, (0, 0), sigmaX=0.9 if not strong else 0.7)
         roi_sharp = cv2.addWeighted(roi_smooth, 1.5 if not strong else 1.8, roi_blur, -0.5 if not strong else -0.8, 0)
         roi_final = cv2.convertScaleAbs(roi_sharp, alpha=1.15 if not strong else 1.25, beta=6 if not strong else 10)
@@ -281,33 +811,28 @@ def enhance_faces(gray, strong: bool = False):
     return out
 
 
-def process_gray(gray, clarity: bool = False, face: bool = False, face_strong: bool = False) -> List[List[int]]:
+def process_gray(gray, clarity: bool = False, face: bool = False, face_strong: bool = False, fast: bool = False):
     """Purpose
     Memproses grayscale dengan clarity dan face enhancement jika diaktifkan.
-    
+
     Parameters
     gray: Array numpy grayscale 2D.
     clarity: Aktifkan peningkatan kejelasan global.
     face: Aktifkan deteksi wajah dan peningkatan lokal.
     face_strong: Aktifkan peningkatan wajah yang lebih agresif.
-    
+    fast: Pakai smoothing rekursif yang lebih murah.
+
     Return value
-    Matriks piksel 2D bernilai 0–255.
+    Array numpy grayscale 2D bernilai 0–255.
     """
-    try:
-        import cv2  # type: ignore
-    except Exception:
-        return [list(row) for row in gray]
+    if cv2 is None:
+        return gray
     work = gray
     if clarity:
-        work = enhance_gray_array(work)
+        work = enhance_gray_array(work, fast=fast)
     if face or face_strong:
-        work = enhance_faces(work, strong=face_strong)
-    h, w = work.shape
-    out: List[List[int]] = []
-    for y in range(h):
-        out.append(list(work[y, :]))
-    return out
+        work = enhance_faces(work, strong=face_strong, fast=fast)
+    return work
 
 
 def get_terminal_width(default_width: int = 80) -> int:
@@ -342,20 +867,110 @@ def render_ascii(lines: List[str]) -> str:
 
 def print_frame(lines: List[str]) -> None:
     """Purpose
-    Mencetak ASCII art ke terminal dengan membersihkan layar terlebih dahulu.
-    
+    Mencetak ASCII art ke terminal berbasis diff: frame sebelumnya disimpan
+    dan hanya baris yang berubah yang dikirim ulang lewat pemosisian kursor
+    (\\x1b[{y};1H), sehingga byte stdout per frame turun drastis untuk scene
+    yang sebagian besar statis. Saat tinggi frame berubah (atau panggilan
+    pertama), seluruh frame dicetak ulang dengan erase-to-EOL per baris.
+
     Parameters
     lines: List baris ASCII.
-    
+
+    Return value
+    None
+    """
+    global _PREV_LINES
+    if len(_PREV_LINES) != len(lines):
+        payload = "\x1b[K\n".join(lines)
+        sys.stdout.buffer.write(b"\x1b[H" + payload.encode("utf-8") + b"\x1b[K\x1b[J\n")
+        sys.stdout.buffer.flush()
+        _PREV_LINES = list(lines)
+        return
+    parts: List[str] = []
+    for y, (old, new) in enumerate(zip(_PREV_LINES, lines)):
+        if old != new:
+            parts.append(f"\x1b[{y + 1};1H{new}\x1b[K")
+    if parts:
+        parts.append(f"\x1b[{len(lines)};1H")
+        sys.stdout.buffer.write("".join(parts).encode("utf-8"))
+        sys.stdout.buffer.flush()
+    _PREV_LINES = list(lines)
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Purpose
+    Menulis bytes mentah ke stdout: os.write langsung ke fd 1 di POSIX;
+    di Windows lewat sys.stdout.buffer agar wrapper ANSI ala colorama
+    tetap bekerja.
+
+    Parameters
+    payload: Bytes yang akan ditulis apa adanya.
+
+    Return value
+    None
+    """
+    if os.name == "nt":
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.flush()
+    else:
+        os.write(1, payload)
+
+
+def print_frame_bytes(frame: bytes) -> None:
+    """Purpose
+    Mencetak frame ASCII yang sudah berbentuk bytes utuh (hasil
+    codes_to_bytes) langsung ke file descriptor stdout: satu syscall per
+    frame, tanpa lapisan encoding/buffering TextIOWrapper.
+
+    Parameters
+    frame: Bytes frame lengkap, tiap baris diakhiri newline.
+
+    Return value
+    None
+    """
+    global _PREV_FRAME_BYTES
+    if frame == _PREV_FRAME_BYTES:
+        # Frame identik dengan yang sudah tampil; tidak perlu menulis ulang.
+        return
+    _write_stdout(b"\x1b[H" + frame + b"\x1b[J")
+    _PREV_FRAME_BYTES = frame
+
+
+def _hide_cursor() -> None:
+    """Purpose
+    Menyembunyikan kursor terminal selama streaming (mengurangi flicker)
+    dan memastikan kursor dikembalikan saat program berakhir.
+
+    Parameters
+    None
+
+    Return value
+    None
+    """
+    global _CURSOR_HIDDEN
+    if not _CURSOR_HIDDEN:
+        _write_stdout(b"\x1b[?25l")
+        _CURSOR_HIDDEN = True
+        atexit.register(_show_cursor)
+
+
+def _show_cursor() -> None:
+    """Purpose
+    Menampilkan kembali kursor terminal yang disembunyikan _hide_cursor.
+
+    Parameters
+    None
+
     Return value
     None
     """
-    sys.stdout.write("\x1b[H\x1b[2J")
-    sys.stdout.write(render_ascii(lines) + "\n")
-    sys.stdout.flush()
+    global _CURSOR_HIDDEN
+    if _CURSOR_HIDDEN:
+        _write_stdout(b"\x1b[?25h")
+        _CURSOR_HIDDEN = False
 
 
-def stream_video_ascii(path: str, width: int = 80, fps_limit: Optional[float] = None, charset: str = " .:-=+*#%@", gamma: float = 1.0, invert: bool = False, dither: bool = False, clarity: bool = False, face: bool = False, face_strong: bool = False) -> None:
+def stream_video_ascii(path: str, width: int = 80, fps_limit: Optional[float] = None, charset: str = " .:-=+*#%@", gamma: float = 1.0, invert: bool = False, dither: bool = False, clarity: bool = False, face: bool = False, face_strong: bool = False, fast: bool = False) -> None:
     """Purpose
     Membaca file video dan menampilkan ASCII art setiap frame di terminal.
     
@@ -370,45 +985,68 @@ def stream_video_ascii(path: str, width: int = 80, fps_limit: Optional[float] =
     Return value
     None
     """
-    try:
-        import cv2  # type: ignore
-    except Exception as e:
-        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python") from e
+    if cv2 is None:
+        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python")
     cap = cv2.VideoCapture(path)
     if not cap.isOpened():
         raise FileNotFoundError(f"Tidak dapat membuka video: {path}")
     delay = 0.0
     if fps_limit and fps_limit > 0:
         delay = 1.0 / fps_limit
+    enhance = face or face_strong
+    _hide_cursor()
     try:
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
-            try:
-                import cv2  # type: ignore
-            except Exception:
-                pass
-            gray = None
-            try:
-                import cv2  # type: ignore
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            except Exception:
-                pass
-            if gray is not None:
-                pixels = process_gray(gray, clarity=clarity, face=face, face_strong=face_strong)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if clarity:
+                gray = enhance_gray_array(gray, fast=fast)
+            if enhance:
+                gray = enhance_faces(gray, strong=face_strong, fast=fast)
+            frame_bytes = frame_to_bytes(gray, width, charset=charset, gamma=gamma, invert=invert, dither=dither)
+            if frame_bytes is not None:
+                print_frame_bytes(frame_bytes)
             else:
-                pixels = frame_to_pixels(frame)
-            resized = resize_pixels(pixels, width)
-            lines = map_to_ascii(resized, charset=charset, gamma=gamma, invert=invert, dither=dither)
-            print_frame(lines)
+                resized = resize_gray(gray, width)
+                lines = map_to_ascii(resized, charset=charset, gamma=gamma, invert=invert, dither=dither)
+                print_frame(lines)
             if delay > 0:
                 time.sleep(delay)
     finally:
         cap.release()
 
 
-def stream_webcam_ascii(camera_index: int = 0, width: int = 80, fps_limit: float = 24.0, charset: str = " .:-=+*#%@", gamma: float = 1.0, invert: bool = False, dither: bool = False, clarity: bool = True, fit: bool = False, face: bool = False, face_strong: bool = False) -> None:
+def _capture_loop(cap, frame_q: "queue.Queue", stop_evt: threading.Event) -> None:
+    """Purpose
+    Loop thread produser: membaca frame dari kamera dan mendorongnya ke
+    antrean terbatas. Bila antrean penuh, frame tertua dibuang agar
+    latency tetap rendah. None dikirim sebagai penanda akhir stream.
+
+    Parameters
+    cap: Objek cv2.VideoCapture yang sudah terbuka.
+    frame_q: Antrean frame menuju thread utama.
+    stop_evt: Event untuk menghentikan loop dari thread utama.
+
+    Return value
+    None
+    """
+    while not stop_evt.is_set():
+        ret, frame = cap.read()
+        if not ret:
+            frame = None
+        if frame_q.full():
+            try:
+                frame_q.get_nowait()
+            except queue.Empty:
+                pass
+        frame_q.put(frame)
+        if frame is None:
+            break
+
+
+def stream_webcam_ascii(camera_index: int = 0, width: int = 80, fps_limit: float = 24.0, charset: str = " .:-=+*#%@", gamma: float = 1.0, invert: bool = False, dither: bool = False, clarity: bool = True, fit: bool = False, face: bool = False, face_strong: bool = False, fast: bool = False, skip_static: bool = False) -> None:
     """Purpose
     Menangkap webcam secara real-time dan menampilkan ASCII art di terminal.
     
@@ -423,36 +1061,77 @@ def stream_webcam_ascii(camera_index: int = 0, width: int = 80, fps_limit: float
     Return value
     None
     """
-    try:
-        import cv2  # type: ignore
-    except Exception as e:
-        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python") from e
+    if cv2 is None:
+        raise RuntimeError("Memerlukan 'opencv-python'. Instal dengan: pip install opencv-python")
     cap = cv2.VideoCapture(camera_index)
     if not cap.isOpened():
         raise RuntimeError(f"Tidak dapat membuka kamera index {camera_index}")
+    try:
+        # Minta MJPG langsung ke driver: banyak webcam hanya sanggup FPS
+        # penuh dalam MJPG, dan decoding JPEG di OpenCV lebih murah daripada
+        # konversi YUYV->BGR bandwidth penuh. Driver yang tidak mendukung
+        # akan mengabaikan permintaan ini dan jalur BGR biasa tetap jalan.
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    except Exception:
+        pass
+    global _TERM_WIDTH_DIRTY
     delay = 1.0 / max(1e-6, fps_limit)
+    has_winch = hasattr(signal, "SIGWINCH")
     if fit:
         tw = get_terminal_width(80)
         width = max(20, tw - 2)
+        _TERM_WIDTH_DIRTY = False
+        if has_winch:
+            try:
+                signal.signal(signal.SIGWINCH, _mark_term_width_dirty)
+            except ValueError:
+                # Bukan main thread; pakai polling seperti di Windows.
+                has_winch = False
+    # Capture dipisah ke thread produser: cap.read() menunggu driver/USB
+    # sementara thread utama memproses frame sebelumnya (OpenCV melepas GIL
+    # di panggilan C-nya, jadi keduanya benar-benar overlap).
+    frame_q: "queue.Queue" = queue.Queue(maxsize=2)
+    stop_evt = threading.Event()
+    grabber = threading.Thread(target=_capture_loop, args=(cap, frame_q, stop_evt), daemon=True)
+    grabber.start()
+    _hide_cursor()
+    frame_no = 0
+    last_thumb = None
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret:
+            frame = frame_q.get()
+            if frame is None:
                 break
-            try:
-                import cv2  # type: ignore
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            except Exception:
-                gray = None
-            if gray is not None:
-                pixels = process_gray(gray, clarity=clarity, face=face, face_strong=face_strong)
+            if fit:
+                frame_no += 1
+                if not has_winch and frame_no % 30 == 0:
+                    _TERM_WIDTH_DIRTY = True
+                if _TERM_WIDTH_DIRTY:
+                    width = max(20, get_terminal_width(80) - 2)
+                    _TERM_WIDTH_DIRTY = False
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if skip_static and np is not None:
+                # Dedup temporal: fingerprint thumbnail 16x16 per frame; bila
+                # selisihnya di bawah ambang, frame dianggap statis dan
+                # seluruh tahap proses+render dilewati (output lama tetap
+                # tampil di terminal).
+                thumb = cv2.resize(gray, (16, 16), interpolation=cv2.INTER_AREA).astype(np.int16)
+                if last_thumb is not None and int(np.abs(thumb - last_thumb).sum()) < 200:
+                    time.sleep(delay)
+                    continue
+                last_thumb = thumb
+            pixels = process_gray(gray, clarity=clarity, face=face, face_strong=face_strong, fast=fast)
+            frame_bytes = frame_to_bytes(pixels, width, charset=charset, gamma=gamma, invert=invert, dither=dither)
+            if frame_bytes is not None:
+                print_frame_bytes(frame_bytes)
             else:
-                pixels = frame_to_pixels(frame)
-            resized = resize_pixels(pixels, width)
-            lines = map_to_ascii(resized, charset=charset, gamma=gamma, invert=invert, dither=dither)
-            print_frame(lines)
+                resized = resize_gray(pixels, width)
+                lines = map_to_ascii(resized, charset=charset, gamma=gamma, invert=invert, dither=dither)
+                print_frame(lines)
             time.sleep(delay)
     finally:
+        stop_evt.set()
+        grabber.join(timeout=1.0)
         cap.release()
 
 
@@ -475,11 +1154,13 @@ def main() -> None:
     parser.add_argument("--charset", type=str, default=" .:-=+*#%@", help="Palet karakter atau kata kunci: simple|dense")
     parser.add_argument("--gamma", type=float, default=0.9, help="Koreksi gamma untuk kontras (default 0.9)")
     parser.add_argument("--invert", action="store_true", help="Balik terang-gelap sebelum pemetaan")
-    parser.add_argument("--dither", action="store_true", help="Aktifkan dithering agar detail lebih jelas")
+    parser.add_argument("--dither", action="store_true", help="Aktifkan dithering agar detail lebih jelas (otomatis dilewati bila charset >= 16 karakter)")
     parser.add_argument("--clarity", action="store_true", help="Tingkatkan kejelasan (CLAHE + sharpen)")
     parser.add_argument("--fit", action="store_true", help="Sesuaikan lebar dengan lebar terminal")
     parser.add_argument("--face", action="store_true", help="Deteksi wajah dan tingkatkan area wajah")
     parser.add_argument("--face-strong", action="store_true", help="Mode wajah lebih agresif")
+    parser.add_argument("--fast", action="store_true", help="Smoothing rekursif yang lebih murah (gantikan bilateral filter)")
+    parser.add_argument("--skip-static", action="store_true", help="Lewati pemrosesan saat frame webcam nyaris identik")
     args = parser.parse_args()
     if args.video:
         path = args.video
@@ -493,14 +1174,14 @@ def main() -> None:
             cs = " .:-=+*#%@"
         elif cs.lower() == "dense":
             cs = " .'`^\",:;Il!i~+_-?][}{1)(|\\/*tfjrxnczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
-        stream_video_ascii(path, width=args.width, fps_limit=args.fps, charset=cs, gamma=args.gamma, invert=args.invert, dither=args.dither, clarity=args.clarity, face=args.face, face_strong=args.face_strong)
+        stream_video_ascii(path, width=args.width, fps_limit=args.fps, charset=cs, gamma=args.gamma, invert=args.invert, dither=args.dither, clarity=args.clarity, face=args.face, face_strong=args.face_strong, fast=args.fast)
     else:
         cs = args.charset
         if cs.lower() == "simple":
             cs = " .:-=+*#%@"
         elif cs.lower() == "dense":
             cs = " .'`^\",:;Il!i~+_-?][}{1)(|\\/*tfjrxnczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
-        stream_webcam_ascii(camera_index=args.camera, width=args.width, fps_limit=args.fps, charset=cs, gamma=args.gamma, invert=args.invert, dither=args.dither, clarity=args.clarity, fit=args.fit, face=args.face, face_strong=args.face_strong)
+        stream_webcam_ascii(camera_index=args.camera, width=args.width, fps_limit=args.fps, charset=cs, gamma=args.gamma, invert=args.invert, dither=args.dither, clarity=args.clarity, fit=args.fit, face=args.face, face_strong=args.face_strong, fast=args.fast, skip_static=args.skip_static)
 
 
 if __name__ == "__main__":
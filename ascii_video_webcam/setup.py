@@ -0,0 +1,13 @@
+"""Build script untuk kernel Cython opsional (_ascii_kernel.pyx).
+
+Jalankan dari folder ini: python setup.py build_ext --inplace
+Modul utama tetap berjalan normal tanpa kernel ini.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="ascii-kernel",
+    ext_modules=cythonize("_ascii_kernel.pyx", language_level="3"),
+)
@@ -1,38 +1,80 @@
+import os
 import subprocess
 import json
 from datetime import datetime, timedelta
 import collections
 
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "tebak_tidur.json")
+
+
+def _load_cache(days):
+    # Hasil query event log di-cache per hari: rerun di hari yang sama
+    # tidak perlu memanggil PowerShell lagi.
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("days") != days or cache.get("date") != datetime.now().strftime("%Y-%m-%d"):
+            return None
+        return [
+            {'time': datetime.fromisoformat(t), 'id': i, 'message': msg}
+            for t, i, msg in cache.get("events", [])
+        ]
+    except Exception:
+        return None
+
+
+def _save_cache(days, events):
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        cache = {
+            "days": days,
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "events": [[e['time'].isoformat(), e['id'], e['message']] for e in events],
+        }
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
 def get_power_events(days=14):
     print(f"Sedang menganalisis histori laptop {days} hari terakhir...")
-    
+
+    cached = _load_cache(days)
+    if cached is not None:
+        return cached
+
+    # Satu objek JSON per baris (NDJSON): Python bisa mem-parse sambil
+    # PowerShell masih menulis, tanpa menahan seluruh output di memori.
     ps_command = f"""
     $startTime = (Get-Date).AddDays(-{days})
-    Get-WinEvent -FilterHashtable @{{LogName='System'; Id=1,42,1074,6006,6005; StartTime=$startTime}} | 
-    Select-Object TimeCreated, Id, Message | 
-    Sort-Object TimeCreated | 
-    ConvertTo-Json -Depth 1
+    Get-WinEvent -FilterHashtable @{{LogName='System'; Id=1,42,1074,6006,6005; StartTime=$startTime}} |
+    Select-Object TimeCreated, Id, Message |
+    Sort-Object TimeCreated |
+    ForEach-Object {{ $_ | ConvertTo-Json -Compress -Depth 1 }}
     """
-    
-    try:
-        # Run PowerShell command
-        result = subprocess.run(["powershell", "-Command", ps_command], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print("Gagal menjalankan perintah PowerShell.")
-            return []
 
-        try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            print("Gagal membaca data event log.")
-            return []
+    try:
+        proc = subprocess.Popen(
+            ["powershell", "-Command", ps_command],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
 
         events = []
-        if isinstance(data, dict): 
-            data = [data]
-            
-        for entry in data:
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
             try:
                 timestamp_raw = entry.get('TimeCreated')
                 # Handle /Date(ms)/ format PowerShell
@@ -53,9 +95,15 @@ def get_power_events(days=14):
             except Exception:
                 continue
 
-        events.sort(key=lambda x: x['time'])
+        proc.stdout.close()
+        if proc.wait() != 0:
+            print("Gagal menjalankan perintah PowerShell.")
+            return []
+
+        # Urutan sudah dijamin Sort-Object di sisi PowerShell.
+        _save_cache(days, events)
         return events
-        
+
     except Exception as e:
         print(f"Terjadi kesalahan: {e}")
         return []
@@ -66,27 +114,47 @@ def analyze_sleep_patterns(events):
         return
 
     sleep_sessions = []
-    
+
     # Heuristic: Gap > 4 hours
-    for i in range(len(events) - 1):
-        current_event = events[i]
-        next_event = events[i+1]
-        
-        current_time = current_event['time']
-        next_time = next_event['time']
-        
-        diff = next_time - current_time 
-        if diff > timedelta(hours=4): 
-            start_hour = current_time.hour
-            end_hour = next_time.hour
-            is_night_start = (19 <= start_hour <= 23) or (0 <= start_hour <= 5)
-            is_morning_end = (4 <= end_hour <= 11) 
-            if is_night_start or is_morning_end:
-                 sleep_sessions.append({
-                    'start': current_time,
-                    'end': next_time,
-                    'duration': diff
-                })
+    if np is not None and len(events) > 1:
+        # Vectorized: semua gap dihitung sekali dengan np.diff, lalu difilter
+        # dengan mask jam malam/pagi. Loop Python hanya untuk sesi terpilih.
+        times = np.array([e['time'] for e in events], dtype='datetime64[us]')
+        gaps = np.diff(times).astype('timedelta64[us]').astype(np.int64)
+        idx = np.where(gaps > 4 * 3600 * 1_000_000)[0]
+        hours = (times.astype('datetime64[s]').astype(np.int64) // 3600) % 24
+        start_hour = hours[idx]
+        end_hour = hours[idx + 1]
+        is_night_start = ((start_hour >= 19) & (start_hour <= 23)) | (start_hour <= 5)
+        is_morning_end = (end_hour >= 4) & (end_hour <= 11)
+        for i in idx[is_night_start | is_morning_end]:
+            current_time = events[int(i)]['time']
+            next_time = events[int(i) + 1]['time']
+            sleep_sessions.append({
+                'start': current_time,
+                'end': next_time,
+                'duration': next_time - current_time
+            })
+    else:
+        for i in range(len(events) - 1):
+            current_event = events[i]
+            next_event = events[i+1]
+
+            current_time = current_event['time']
+            next_time = next_event['time']
+
+            diff = next_time - current_time
+            if diff > timedelta(hours=4):
+                start_hour = current_time.hour
+                end_hour = next_time.hour
+                is_night_start = (19 <= start_hour <= 23) or (0 <= start_hour <= 5)
+                is_morning_end = (4 <= end_hour <= 11)
+                if is_night_start or is_morning_end:
+                    sleep_sessions.append({
+                        'start': current_time,
+                        'end': next_time,
+                        'duration': diff
+                    })
 
     if not sleep_sessions:
         print("Belum cukup data untuk menebak pola tidur.")